@@ -20,30 +20,277 @@ import os
 import curses
 from curses import wrapper
 import argparse
+import functools
+from array import array
+from itertools import repeat, accumulate
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+
+# The dump is read in chunks of this size rather than all at once
+_CHUNK_SIZE = 8 * 1024 * 1024
+
+# Of statements other than CREATE, only this much of the start is kept for parse() to match,
+# so the rest of a long INSERT needn't stay in memory; enough for any column list
+_STATEMENT_HEAD_SIZE = 1024 * 1024
+
+# Tables with at least this much INSERT data have their rows parsed by a pool of worker
+# processes, which are handed batches of roughly this much data at a time
+_PARALLEL_MIN_SIZE = 32 * 1024 * 1024
+_BATCH_SIZE = 4 * 1024 * 1024
+
+# Short string values are deduplicated through this table, up to a bounded number of entries
+_INTERN_MAX_LEN = 64
+_INTERN_MAX_COUNT = 1 << 16
+_interned_strings = {}
+
+# Typecodes of the arrays that columns holding only ints or only floats are packed into
+_PACKED_TYPECODES = {int: 'q', float: 'd'}
+
+# Separates the cells of a row in its search blob; not something a search query will contain
+_SEARCH_SEP = '\x1f'
+
+# Rows are searched in blocks of this many rows, separated within a block by _SEARCH_ROW_SEP
+_SEARCH_BLOCK_ROWS = 64
+_SEARCH_ROW_SEP = '\x1e'
+_SEARCH_ROW_SEP_BYTES = _SEARCH_ROW_SEP.encode()
+
+# Statement heads, matched at the start of each statement
+_CREATE_TABLE_RE = re.compile(rb"CREATE\s+TABLE\s+`?([^`\s(]+)`?\s*\(", re.IGNORECASE)
+_INSERT_INTO_RE = re.compile(
+    rb"INSERT\s+INTO\s+`?([^`\s(]+)`?\s*(?:\(([^)]+)\))?\s*VALUES\s*",
+    re.IGNORECASE
+)
+
+# As much of a statement as can be scanned before its terminating ';', skipping over quoted
+# literals, and the body of a quoted literal up to its closing quote. Both are unrolled loops
+# that always match, stopping where the scan can later be resumed once more data is read
+_STATEMENT_RE = re.compile(rb"[^';]*(?:'[^'\\]*(?:\\.[^'\\]*)*'[^';]*)*", re.DOTALL)
+_QUOTED_BODY_RE = re.compile(rb"[^'\\]*(?:\\.[^'\\]*)*", re.DOTALL)
+
+# The regex engine keeps state for each repetition within a match, so statements are matched
+# this much at a time rather than a whole chunk at once
+_SCAN_WINDOW = 64 * 1024
+
+# Scanning patterns for parenthesised bodies: the next character of interest, and the rest
+# of a quoted literal after its opening quote
+_PAREN_DELIM_RE = re.compile(rb"[()']")
+_QUOTED_TAIL_RE = re.compile(rb"[^'\\]*(?:\\.[^'\\]*)*'", re.DOTALL)
+_SPACE_RE = re.compile(rb"\s*")
+
+# One value of a VALUES list: the separators and tuple opening before it, then a quoted string
+# body (quotes escaped by a backslash or doubled), a plain integer, or any other unquoted
+# literal, then the ')' if it closes its tuple. An unquoted literal may contain up to two levels
+# of parenthesised arguments holding quoted literals, e.g. POINT(1,2) or
+# CONCAT('a', LOWER('B')), and may be followed by a quoted literal it prefixes, e.g.
+# _binary 'ab' or X'0A'. The whole list is tokenized by a single findall, leaving only the
+# conversion of each value to Python
+_QUOTED_PATTERN = r"'[^'\\]*(?:(?:\\.|'')[^'\\]*)*'"
+_INNER_PARENS_PATTERN = r"\([^'()]*(?:" + _QUOTED_PATTERN + r"[^'()]*)*\)"
+_PARENS_PATTERN = r"\([^'()]*(?:(?:" + _QUOTED_PATTERN + "|" + _INNER_PARENS_PATTERN + r")[^'()]*)*\)"
+_UNQUOTED_PATTERN = r"(?:[^,'()\s]|" + _PARENS_PATTERN + r")+"
+_VALUE_TOKEN_RE = re.compile(
+    r"[\s,(]*"
+    r"(?:'([^'\\]*(?:(?:\\.|'')[^'\\]*)*)'"
+    r"|(-?\d+)(?=\s*[,)])"
+    r"|(" + _UNQUOTED_PATTERN + r"(?:\s+" + _UNQUOTED_PATTERN + r")*(?:\s*" + _QUOTED_PATTERN + r")?))"
+    r"\s*(\))?",
+    re.DOTALL
+)
+
+# A quoted literal, skipped whole, or the gap between two tuples of a VALUES list; used to find
+# where a long VALUES list can be split between workers
+_TUPLE_GAP_RE = re.compile(rb"'[^'\\]*(?:\\.[^'\\]*)*'|\)\s*,\s*\(", re.DOTALL)
+
+# One comma-separated definition of a CREATE TABLE body, skipping over quoted literals and
+# parenthesised arguments (e.g. enum types), and the column name at the start of a definition.
+# Matched forwards in one pass, unlike a lookahead split which rescans the body after each comma
+_COL_DEF_RE = re.compile(
+    r"(?:[^,'()]+|'[^'\\]*(?:\\.[^'\\]*)*'"
+    r"|\([^'()]*(?:(?:'[^'\\]*(?:\\.[^'\\]*)*'|\([^'()]*\))[^'()]*)*\))+",
+    re.DOTALL
+)
+_COL_NAME_RE = re.compile(r"`?(\w+)`?\s+[^,]*")
+
+# Backslash escapes written by mysqldump, and doubled quotes; any other escaped character
+# stands for itself, except % and _ which MySQL keeps escaped
+_SQL_ESCAPE_RE = re.compile(r"[\\'](.)", re.DOTALL)
+_SQL_ESCAPES = {
+    '0': '\0', 'b': '\b', 'n': '\n', 'r': '\r', 't': '\t', 'Z': '\x1a',
+    '%': '\\%', '_': '\\_',
+}
+
+# Status lines of the table views
+_PAGE_STATUS = "Rows: %d-%d of %d | Pages: %d/%d"
+_COLUMN_STATUS = "Columns: %d-%d of %d | Column Pages: %d/%d"
+_SEARCH_STATUS = {False: "Search: Inactive", True: "Search: Active"}
+
+# Control characters in values are shown as spaces, keeping each row on one line of the display
+_DISPLAY_TRANS = dict.fromkeys(range(32), ' ')
+
+def _find_closing_paren(buffer, pos):
+    """
+    Finds the ')' closing a parenthesis opened just before pos, skipping quoted literals.
+    Returns -1 if it is not closed.
+    """
+    depth = 1
+    while True:
+        match = _PAREN_DELIM_RE.search(buffer, pos)
+        if match is None:
+            return -1
+        char = buffer[match.start()]
+        if char == 0x28:  # '('
+            depth += 1
+        elif char == 0x29:  # ')'
+            depth -= 1
+            if depth == 0:
+                return match.start()
+        else:
+            literal = _QUOTED_TAIL_RE.match(buffer, match.end())
+            if literal is None:
+                return -1
+            pos = literal.end()
+            continue
+        pos = match.end()
+
+def _skip_comments(buffer, pos, eof):
+    """
+    Skips whitespace and comments before the statement starting at or after pos.
+    Returns None if more data is needed to tell where the statement starts.
+    """
+    while True:
+        pos = _SPACE_RE.match(buffer, pos).end()
+        if not eof and len(buffer) - pos < 3:
+            return None
+        if buffer.startswith((b'--', b'#'), pos):
+            newline = buffer.find(b'\n', pos)
+            if newline == -1:
+                return len(buffer) if eof else None
+            pos = newline + 1
+        elif buffer.startswith(b'/*', pos) and not buffer.startswith(b'/*!', pos):
+            close = buffer.find(b'*/', pos + 2)
+            if close == -1:
+                return len(buffer) if eof else None
+            pos = close + 2
+        else:
+            return pos
+
+def _scan_statement(buffer, pos, in_quote):
+    """
+    Scans for the ';' ending the statement being read, from pos, which is inside a quoted
+    literal if in_quote. Returns (end, in_quote), where end is the index of the ';', or the
+    point to resume from, with the updated in_quote, once more data has been read.
+    """
+    end = len(buffer)
+    while True:
+        window = min(pos + _SCAN_WINDOW, end)
+        if in_quote:
+            pos = _QUOTED_BODY_RE.match(buffer, pos, window).end()
+            if not buffer.startswith(b"'", pos):
+                if window < end:
+                    continue  # Stopped at the end of the window
+                return pos, True
+            pos += 1
+            in_quote = False
+            continue
+        pos = _STATEMENT_RE.match(buffer, pos, window).end()
+        if buffer.startswith(b"'", pos):
+            # A literal not closed within the window
+            in_quote = True
+            pos += 1
+        elif pos < window or window == end:
+            return pos, False
+
+def _parse_tuples(values_str):
+    """
+    Parses the tuples of a VALUES list into lists of values.
+    Handles SQL escaping and NULLs.
+    """
+    rows = []
+    values = []
+    append = values.append
+    for quoted, integer, raw, close in _VALUE_TOKEN_RE.findall(values_str):
+        if integer:
+            append(int(integer))
+        elif raw:
+            char = raw[0]
+            if (char == 'N' or char == 'n') and raw.upper() == 'NULL':
+                append(None)
+            elif char == '-' or '0' <= char <= '9':
+                append(_coerce_number(raw))
+            else:
+                append(raw)
+        else:
+            value = _sql_unescape(quoted)
+            # Share one object between repeated short strings (enum-like columns), up to a bounded table size
+            if len(value) <= _INTERN_MAX_LEN:
+                if len(_interned_strings) < _INTERN_MAX_COUNT:
+                    value = _interned_strings.setdefault(value, value)
+                else:
+                    value = _interned_strings.get(value, value)
+            append(value)
+        if close:
+            rows.append(values)
+            values = []
+            append = values.append
+    return rows
+
+def _unescape_match(match):
+    char = match.group(1)
+    return _SQL_ESCAPES.get(char, char)
+
+def _sql_unescape(text):
+    """
+    Resolves the backslash escapes and doubled quotes of a string literal body in a single pass.
+    """
+    if '\\' not in text and "'" not in text:
+        return text
+    return _SQL_ESCAPE_RE.sub(_unescape_match, text)
+
+def _coerce_number(raw):
+    """
+    Converts an unquoted numeric literal to an int or float, or returns it unchanged.
+    """
+    digits = raw[1:] if raw[0] == '-' else raw
+    if digits.isdecimal():
+        return int(raw)
+    if digits.replace('.', '', 1).isdecimal():
+        return float(raw)
+    # Only exponent notation (e.g. 1.5e-07) is left to float() to decide, so other
+    # unquoted tokens such as hex literals don't go through a raised ValueError
+    if 'e' in digits or 'E' in digits:
+        try:
+            return float(raw)
+        except ValueError:
+            pass
+    return raw
 
 class SQLDumpParser:
-    def __init__(self, filepath, verbose=False):
+    def __init__(self, filepath, verbose=False, jobs=None):
         self.filepath = filepath
         self.tables = {}  # Dictionary to hold table data
         self.verbose = verbose
+        self.jobs = jobs  # Worker processes for large dumps, defaults to the CPU count
 
     def parse(self):
         """
-        Parses the SQL dump file to extract table schemas and data from CREATE TABLE and INSERT statements.
+        Parses the SQL dump file to extract table schemas from CREATE TABLE statements and index
+        the INSERT statements of each table. The file is streamed in chunks and tokenized in a
+        single pass over its statements; rows are only parsed when a table is loaded.
         """
-        # Regex patterns
-        create_table_regex = re.compile(
-            r"CREATE TABLE\s+`?(\w+)`?\s*\((.*?)\)\s*ENGINE=",
-            re.IGNORECASE | re.DOTALL
-        )
-        insert_into_regex = re.compile(
-            r"INSERT INTO\s+`?(\w+)`?\s*(?:\(([^)]+)\))?\s+VALUES\s+(.+?);",
-            re.IGNORECASE | re.DOTALL
-        )
-
+        handlers = {
+            b'CREATE': self._handle_create,
+            b'INSERT': self._handle_insert,
+        }
         try:
-            with open(self.filepath, 'r', encoding='utf-8') as file:
-                content = file.read()
+            # Chunks are read straight into the parse buffer, so no extra buffering layer is needed
+            with open(self.filepath, 'rb', buffering=0) as file:
+                if hasattr(os, 'posix_fadvise'):
+                    # The dump is read front to back once; let the kernel read ahead aggressively
+                    os.posix_fadvise(file.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                for offset, length, statement in self._iter_statements(file):
+                    handler = handlers.get(bytes(statement[:6]).upper())
+                    if handler:
+                        handler(offset, length, statement)
         except FileNotFoundError:
             print(f"Error: File '{self.filepath}' not found.")
             sys.exit(1)
@@ -51,171 +298,477 @@ class SQLDumpParser:
             print(f"Error reading file: {e}")
             sys.exit(1)
 
-        # Parse CREATE TABLE statements to get column names
-        for match in create_table_regex.finditer(content):
-            table_name = match.group(1)
-            columns_def = match.group(2)
-            columns = self._extract_columns(columns_def)
-            if columns:
-                self.tables[table_name] = {
-                    'columns': columns,
-                    'rows': []
-                }
-                if self.verbose:
-                    print(f"Found table: {table_name} with columns: {columns}")
-            else:
-                if self.verbose:
-                    print(f"Warning: No columns found for table '{table_name}'.")
-
-        # Parse INSERT INTO statements
-        for match in insert_into_regex.finditer(content):
-            table_name = match.group(1)
-            columns_str = match.group(2)
-            values_str = match.group(3)
-
-            if table_name not in self.tables:
-                if self.verbose:
-                    print(f"Warning: INSERT statement for unknown table '{table_name}'. Skipping.")
-                continue
+        if self.verbose:
+            print(f"Parsing completed. Total tables parsed: {len(self.tables)}.")
 
-            # Determine columns
-            if columns_str:
-                columns = [col.strip(" `") for col in columns_str.split(",")]
-            else:
-                columns = self.tables[table_name]['columns']
+    def _iter_statements(self, file):
+        """
+        Yields (offset, length, statement) for each statement in the file, where offset and
+        length locate it without leading comments or the trailing ';'. statement holds the whole
+        statement, except for a long statement other than CREATE, where it only holds the first
+        _STATEMENT_HEAD_SIZE bytes and the rest is dropped as it is scanned. Only the statement
+        currently being scanned is carried over between chunks, and its scan resumes where it
+        stopped, so a statement spanning many chunks is scanned only once.
+        """
+        buffer = bytearray()
+        chunk = bytearray(_CHUNK_SIZE)  # Reused for every read
+        chunk_view = memoryview(chunk)
+        base = 0  # File offset of the start of the buffer
+        start = 0  # Start of the current statement, or of its unscanned rest once head is taken
+        offset = None  # File offset of the current statement, once its start is known
+        head = None  # Start of a long statement whose rest isn't kept
+        scan = None  # Where scanning of the current statement resumes, once its start is known
+        in_quote = False  # Whether scan is inside a quoted literal
+        eof = False
+        while True:
+            if scan is None:
+                pos = _skip_comments(buffer, start, eof)
+                if pos is not None:
+                    start = scan = pos
+                    offset = base + pos
+            if scan is not None:
+                scan, in_quote = _scan_statement(buffer, scan, in_quote)
+                ended = not in_quote and scan < len(buffer)
+                if ended or eof:
+                    end = scan if ended else len(buffer)
+                    if base + end > offset:
+                        # Sliced straight from the buffer: a single copy of the statement
+                        statement = buffer[start:end] if head is None else head
+                        yield offset, base + end - offset, statement
+                    if not ended:
+                        return
+                    start = scan + 1
+                    head = scan = None
+                    continue
+                if head is None and len(buffer) - start >= _STATEMENT_HEAD_SIZE \
+                        and buffer[start:start + 6].upper() != b'CREATE':
+                    head = buffer[start:start + _STATEMENT_HEAD_SIZE]
+                if head is not None:
+                    start = scan  # The scanned part of the statement is no longer needed
+            # Drop the consumed data and read the next chunk. The rest is copied to a new buffer,
+            # as deleting from the front of a bytearray doesn't give back its memory
+            if start:
+                buffer = buffer[start:]
+            base += start
+            if scan is not None:
+                scan -= start
+            start = 0
+            size = file.readinto(chunk)
+            eof = not size
+            buffer += chunk_view[:size]
+
+    def _handle_create(self, offset, length, statement):
+        """
+        Records the columns of a CREATE TABLE statement.
+        """
+        match = _CREATE_TABLE_RE.match(statement)
+        if match is None:
+            return
+        end = _find_closing_paren(statement, match.end())
+        if end == -1:
+            return
+        table_name = match.group(1).decode('utf-8')
+        columns_def = statement[match.end():end].decode('utf-8')
+        columns = list(self._extract_columns(columns_def))
+        if columns:
+            # Rows are parsed by load_table() from the recorded INSERT statements, and stored
+            # column-wise: one list of values per column
+            self.tables[table_name] = {
+                'columns': columns,
+                'inserts': [],  # (offset, length, columns) of the VALUES list of each INSERT
+                'row_count': 0,
+                'col_arrays': None
+            }
+            if self.verbose:
+                print(f"Found table: {table_name} with columns: {columns}")
+        else:
+            if self.verbose:
+                print(f"Warning: No columns found for table '{table_name}'.")
 
-            # Validate columns length with the table's columns if columns are specified
-            if columns_str and len(columns) != len(self.tables[table_name]['columns']):
-                if self.verbose:
-                    print(f"Warning: Column count mismatch in INSERT INTO '{table_name}'. Expected {len(self.tables[table_name]['columns'])}, got {len(columns)}. Skipping these inserts.")
-                continue
+    def _handle_insert(self, offset, length, statement):
+        """
+        Records where the VALUES list of an INSERT INTO statement lies in the file, for its
+        rows to be parsed when the table is loaded.
+        """
+        match = _INSERT_INTO_RE.match(statement)
+        if match is None:
+            return
+        table_name = match.group(1).decode('utf-8')
+        columns_str = match.group(2) and match.group(2).decode('utf-8')
 
-            # Split and parse values
-            values = self._split_values(values_str)
-            for val in values:
-                parsed_row = self._parse_values(val)
-                if parsed_row:
-                    # If columns are specified in INSERT, map them accordingly
-                    if columns_str:
-                        row = {col: val for col, val in zip(columns, parsed_row)}
-                        # Reorder according to table's column order
-                        ordered_row = [row.get(col, None) for col in self.tables[table_name]['columns']]
-                        self.tables[table_name]['rows'].append(ordered_row)
-                    else:
-                        self.tables[table_name]['rows'].append(parsed_row)
+        if table_name not in self.tables:
             if self.verbose:
-                print(f"Inserted {len(values)} rows into table '{table_name}'.")
+                print(f"Warning: INSERT statement for unknown table '{table_name}'. Skipping.")
+            return
 
-        if self.verbose:
-            print(f"Parsing completed. Total tables parsed: {len(self.tables)}.")
+        # Determine columns
+        if columns_str:
+            columns = [col.strip(" `") for col in columns_str.split(",")]
+        else:
+            columns = None
+
+        # Validate columns length with the table's columns if columns are specified
+        if columns and len(columns) != len(self.tables[table_name]['columns']):
+            if self.verbose:
+                print(f"Warning: Column count mismatch in INSERT INTO '{table_name}'. Expected {len(self.tables[table_name]['columns'])}, got {len(columns)}. Skipping these inserts.")
+            return
+
+        self.tables[table_name]['inserts'].append((offset + match.end(), length - match.end(), columns))
+
+    def load_table(self, table_name):
+        """
+        Parses the rows of a table from its recorded INSERT statements, unless already loaded,
+        and returns the table. Tables with a lot of INSERT data are parsed by a pool of worker
+        processes; either way the values are read straight from the file in batches.
+        """
+        table = self.tables[table_name]
+        if table['col_arrays'] is not None:
+            return table
+        table['col_arrays'] = [[] for _ in table['columns']]
+        table['row_count'] = 0
+
+        jobs = self.jobs or os.cpu_count() or 1
+        total_size = sum(length for _, length, _ in table['inserts'])
+        parallel = jobs > 1 and total_size >= _PARALLEL_MIN_SIZE
+        try:
+            inserts = table['inserts']
+            if parallel:
+                # Long VALUES lists are split between tuples, so that a dump written as a few
+                # huge INSERT statements is still shared out between the workers
+                with open(self.filepath, 'rb') as file:
+                    inserts = [
+                        (piece_offset, piece_length, columns)
+                        for offset, length, columns in inserts
+                        for piece_offset, piece_length in _split_values_list(file, offset, length)
+                    ]
+
+            batches = []
+            batch = []
+            batch_size = 0
+            for offset, length, columns in inserts:
+                batch.append((offset, length, columns, table['columns']))
+                batch_size += length
+                if batch_size >= _BATCH_SIZE:
+                    batches.append(batch)
+                    batch = []
+                    batch_size = 0
+            if batch:
+                batches.append(batch)
+
+            # A single batch is parsed in this process, rather than by one worker that would
+            # also have to send every row back
+            if parallel and len(batches) > 1:
+                with ProcessPoolExecutor(max_workers=min(jobs, len(batches))) as executor:
+                    # Results come back in file order, so rows keep the order of the dump
+                    for batch_rows in executor.map(_parse_insert_batch, repeat(self.filepath), batches):
+                        for rows in batch_rows:
+                            self._add_rows(table, rows)
+            else:
+                for batch in batches:
+                    for rows in _parse_insert_batch(self.filepath, batch):
+                        self._add_rows(table, rows)
+        except Exception as e:
+            # Rows are read long after parse(), so the dump may be undecodable or gone by now.
+            # The message is printed on exit, once curses (if in use) has restored the terminal
+            sys.exit(f"Error reading file: {e}")
+        table['col_arrays'] = [_pack_column(col_array) for col_array in table['col_arrays']]
+        return table
+
+    def unload_table(self, table_name):
+        """
+        Drops the parsed rows of a table, keeping its recorded INSERT statements so that
+        load_table() can parse them again.
+        """
+        table = self.tables[table_name]
+        table['col_arrays'] = None
+        table['row_count'] = 0
+
+    def _parse_rows(self, values_str, columns, table_columns):
+        """
+        Parses the VALUES list of an INSERT statement into rows in the table's column order.
+        columns is the INSERT's own column list, or None if it has none.
+        """
+        rows = []
+        num_columns = len(table_columns)
+        perm = None
+        if columns:
+            # Position in the INSERT's column list of each table column (-1 if absent),
+            # worked out once per statement rather than per row
+            col_pos = {col: i for i, col in enumerate(columns)}
+            perm = [col_pos.get(col, -1) for col in table_columns]
+            if perm == list(range(num_columns)):
+                perm = None  # Already in table order
+        for parsed_row in _parse_tuples(values_str):
+            if parsed_row:
+                # Every row needs a value for each column to be stored column-wise
+                if len(parsed_row) != num_columns:
+                    parsed_row = (parsed_row + [None] * num_columns)[:num_columns]
+                # If columns are specified in INSERT in another order, map them accordingly
+                if perm:
+                    parsed_row = [parsed_row[j] if j >= 0 else None for j in perm]
+                rows.append(parsed_row)
+        return rows
+
+    def _add_rows(self, table, rows):
+        """
+        Appends parsed rows to a table's column arrays.
+        """
+        for col_array, values in zip(table['col_arrays'], zip(*rows)):
+            col_array.extend(values)
+        table['row_count'] += len(rows)
 
-    def _extract_columns(self, columns_def):
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _extract_columns(columns_def):
         """
         Extracts column names from the columns definition part of CREATE TABLE statement.
+        Cached, as dumps can repeat the same table definition; returns a tuple so the cached
+        result can't be modified.
         """
         columns = []
         # Split the columns_def by commas, but ignore commas inside parentheses (e.g., enum types)
-        column_lines = re.split(r",\s*(?![^()]*\))", columns_def)
+        column_lines = _COL_DEF_RE.findall(columns_def)
         for line in column_lines:
             line = line.strip()
             # Match column definitions (exclude PRIMARY KEY, KEY, etc.)
-            col_match = re.match(r"`?(\w+)`?\s+[^,]*", line)
+            col_match = _COL_NAME_RE.match(line)
             if col_match and not line.upper().startswith(('PRIMARY KEY', 'KEY', 'UNIQUE KEY', 'CONSTRAINT')):
                 column_name = col_match.group(1)
                 columns.append(column_name)
-        return columns
+        return tuple(columns)
 
-    def _split_values(self, values_str):
-        """
-        Splits the VALUES string into individual tuples.
-        Handles commas within strings and parentheses correctly.
-        """
-        values = []
-        current = ''
-        depth = 0
-        in_string = False
-        escape = False
-
-        for char in values_str:
-            if char == "'" and not escape:
-                in_string = not in_string
-            if char == "\\" and in_string:
-                escape = not escape
-            else:
-                escape = False
-
-            if char == '(' and not in_string:
-                depth += 1
-            elif char == ')' and not in_string:
-                depth -= 1
-
-            if char == ',' and depth == 0 and not in_string:
-                if current.strip():
-                    values.append(current.strip())
-                    current = ''
-                continue
-            current += char
-
-        if current.strip():
-            values.append(current.strip())
-        return values
+def _split_values_list(file, offset, length):
+    """
+    Splits the VALUES list at offset into pieces of whole tuples of about _BATCH_SIZE bytes,
+    returning the (offset, length) of each. A tuple much longer than that ends the splitting.
+    """
+    pieces = []
+    end = offset + length
+    while end - offset > _BATCH_SIZE:
+        file.seek(offset)
+        data = file.read(min(_BATCH_SIZE + _SCAN_WINDOW, end - offset))
+        # Each piece starts between tuples, outside any quoted literal, so the statement scan
+        # tells whether _BATCH_SIZE falls inside one. From there the first tuple gap is found
+        # by walking over the literals; a quote not closed within data ends the walk
+        pos, in_quote = _scan_statement(data[:_BATCH_SIZE], 0, False)
+        if in_quote:
+            pos = _QUOTED_BODY_RE.match(data, pos).end()
+            pos = pos + 1 if data.startswith(b"'", pos) else len(data)
+        split = None
+        for match in _TUPLE_GAP_RE.finditer(data, pos):
+            if data.find(b"'", pos, match.start()) != -1:
+                break
+            if data[match.start()] == 0x29:  # ')'
+                split = match.end() - 1
+                break
+            pos = match.end()
+        if split is None:
+            break
+        pieces.append((offset, split))
+        offset += split
+    pieces.append((offset, end - offset))
+    return pieces
+
+def _parse_insert_batch(filepath, batch):
+    """
+    Parses a batch of INSERT values, in a worker process for large tables. Each entry of the batch is
+    (offset, length, columns, table_columns) locating the values in the file.
+    Returns the parsed rows of each entry, in batch order.
+    """
+    parser = SQLDumpParser(filepath)
+    results = []
+    with open(filepath, 'rb') as file:
+        for offset, length, columns, table_columns in batch:
+            file.seek(offset)
+            values_str = file.read(length).decode('utf-8')
+            results.append(parser._parse_rows(values_str, columns, table_columns))
+    return results
+
+def _pack_column(col_array):
+    """
+    Returns a column as a typed array if its values are all ints or all floats (no NULLs),
+    storing them unboxed, or otherwise returns it unchanged.
+    """
+    types = set(map(type, col_array))
+    if len(types) == 1:
+        typecode = _PACKED_TYPECODES.get(types.pop())
+        if typecode:
+            try:
+                return array(typecode, col_array)
+            except OverflowError:
+                pass  # Integers beyond 64 bits stay as Python ints
+    return col_array
 
-    def _parse_values(self, val_str):
-        """
-        Parses a single VALUES tuple into a list of values.
-        Handles SQL escaping and NULLs.
-        """
-        # Remove the surrounding parentheses
-        val_str = val_str.strip('()')
+def _build_search_index(table):
+    """
+    Returns (text, offsets) for searching a table's rows. text is the lowercased text of all
+    rows as UTF-8 bytes, with cells joined by _SEARCH_SEP (NULLs as empty cells) and rows by
+    _SEARCH_ROW_SEP; unlike a str, a single non-ASCII character doesn't widen every character
+    of it to 2 or 4 bytes. The rows are grouped in blocks of _SEARCH_BLOCK_ROWS, and offsets
+    holds the start of each block followed by len(text) + 1, so block i is
+    text[offsets[i]:offsets[i + 1] - 1].
+    """
+    columns = [['' if val is None else str(val) for val in col_array] for col_array in table['col_arrays']]
+    blobs = list(map(_SEARCH_SEP.join, zip(*columns)))
+    # A value containing the row separator would throw off the row positions within its block
+    if _SEARCH_ROW_SEP.join(blobs).count(_SEARCH_ROW_SEP) >= len(blobs):
+        blobs = [blob.replace(_SEARCH_ROW_SEP, ' ') for blob in blobs]
+    blocks = [
+        _SEARCH_ROW_SEP.join(blobs[start:start + _SEARCH_BLOCK_ROWS]).lower().encode()
+        for start in range(0, len(blobs), _SEARCH_BLOCK_ROWS)
+    ]
+    offsets = array('q', accumulate((len(block) + 1 for block in blocks), initial=0))
+    return _SEARCH_ROW_SEP_BYTES.join(blocks), offsets
+
+def _match_spans(text, terms):
+    """
+    Returns the sorted, non-overlapping (start, end) spans of text matching any of the
+    lowercase search terms, ignoring case.
+    """
+    lower = text.lower()
+    spans = []
+    for term in terms:
+        start = lower.find(term)
+        while start != -1:
+            spans.append((start, start + len(term)))
+            start = lower.find(term, start + len(term))
+    spans.sort()
+    merged = []
+    for start, end in spans:
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
 
-        # Split by commas not within quotes
-        pattern = re.compile(r"""
-            '(?:\\'|[^'])*' |  # Single quoted strings, handling escaped quotes
-            NULL |            # NULL
-            [^,]+             # Other values
-        """, re.VERBOSE | re.IGNORECASE)
+def _display_value(val):
+    """
+    Returns a value as shown in a table cell: NULL for None, on one line, at most 30 characters.
+    """
+    val_str = 'NULL' if val is None else str(val).translate(_DISPLAY_TRANS)
+    if len(val_str) > 30:
+        val_str = val_str[:27] + "..."
+    return val_str
 
-        raw_values = pattern.findall(val_str)
-        values = []
-        for raw in raw_values:
-            raw = raw.strip()
-            if not raw:
-                continue
-            if raw.upper() == 'NULL':
-                values.append(None)
-            elif raw.startswith("'") and raw.endswith("'"):
-                # Remove surrounding quotes and handle escaped quotes
-                val = raw[1:-1].replace("\\'", "'").replace("\\\\", "\\")
-                values.append(val)
-            else:
-                # Try to convert to int or float
-                if re.match(r'^-?\d+$', raw):
-                    try:
-                        values.append(int(raw))
-                    except ValueError:
-                        values.append(raw)
-                elif re.match(r'^-?\d+\.\d*$', raw):
-                    try:
-                        values.append(float(raw))
-                    except ValueError:
-                        values.append(raw)
-                else:
-                    values.append(raw)
-        return values
+def _draw_line(stdscr, y, text):
+    """
+    Writes one line of a curses frame, cut to the window width so it can't wrap onto the
+    next line. Returns False if the window is too small to show the line at all.
+    """
+    try:
+        stdscr.addstr(y, 0, text[:curses.COLS - 1])
+    except curses.error:
+        return False
+    return True
 
 class SpreadsheetNavigator:
-    def __init__(self, tables):
-        self.tables = tables
+    def __init__(self, parser):
+        self.parser = parser  # Loads the rows of a table when it is first selected
+        self.tables = parser.tables
+        self._loaded_table = None  # Name of the table whose rows are in memory
         self.current_table = None
         self.page_size = 20  # Number of rows per page
+        self.rows_per_page = self.page_size  # Rows actually shown per page, fewer if the window is short
         self.current_page = 0
         self.col_page_size = 5  # Number of columns per column page
         self.current_col_page = 0
+        self.window_width = None  # Usable width of the curses window, None outside curses
+        self.col_page_starts = []  # First column of each column page of the current table
         self.table_page_size = 20  # Number of tables per table list page
         self.current_table_page = 0
-        self.all_rows = []  # To store all rows for searching
-        self.filtered_rows = []  # To store filtered rows after search
+        self.all_rows = range(0)  # Indices of all rows of the current table
+        # Indices of the rows left after search. Either all_rows itself or a list built by the
+        # search, so it is only ever reassigned, never modified in place
+        self.filtered_rows = self.all_rows
+        self.total_pages = 0  # Row pages of filtered_rows, kept up to date by _update_page_counts()
+        self.total_col_pages = 0  # Column pages of the current table
         self.search_active = False  # Flag to indicate if search filter is active
+        self._prev_lines = []  # Lines of the last page frame drawn by display_page_curses
+        self._display_cache = {}  # Display strings of the current table's cells, by column then row
+        self._layout = None  # Header, separator and widths of the columns shown, see _view_layout
+        self._layout_key = None
+
+    def _set_current_table(self, table_name):
+        """
+        Makes table_name the current table and resets paging and row search for it.
+        Only the current table's rows are kept in memory: the previously loaded table is
+        unloaded, and parsed again if it is selected later.
+        """
+        if self._loaded_table is not None and self._loaded_table != table_name:
+            previous = self.tables[self._loaded_table]
+            previous.pop('col_widths', None)
+            previous.pop('search_index', None)
+            self.parser.unload_table(self._loaded_table)
+        self.current_table = self.parser.load_table(table_name)
+        self._loaded_table = table_name
+        self._prev_lines = []
+        self._display_cache = {}
+        self._layout_key = None
+        self.current_page = 0
+        self.current_col_page = 0
+        self.current_table_page = 0  # Reset table list page after selection
+        self.all_rows = range(self.current_table['row_count'])
+        self.filtered_rows = self.all_rows
+        self.search_active = False
+        self._update_page_counts()
+
+    def _update_page_counts(self):
+        """
+        Recomputes the row and column page counts, after the current table or row filter changes.
+        """
+        total_rows = len(self.filtered_rows)
+        self.total_pages = (total_rows // self.rows_per_page) + (1 if total_rows % self.rows_per_page else 0)
+        self.col_page_starts = self._column_page_starts()
+        self.total_col_pages = len(self.col_page_starts)
+
+    def _column_page_starts(self):
+        """
+        Returns the first column of each column page of the current table. A page holds up to
+        col_page_size columns, and in the curses window only as many as fit in its width, so
+        that every column is shown in full on some page.
+        """
+        num_columns = len(self.current_table['columns'])
+        if self.window_width is None:
+            return list(range(0, num_columns, self.col_page_size))
+        starts = []
+        count = 0
+        x = 0
+        for col, width in enumerate(self._column_widths()):
+            # A page always gets at least one column, cut if the window is narrower than it
+            if not starts or count == self.col_page_size or x + width > self.window_width:
+                starts.append(col)
+                count = 0
+                x = 0
+            x += width + 4  # Padded width and the "| " after it
+            count += 1
+        return starts
+
+    def _column_page_range(self):
+        """
+        Returns (start_col, end_col) of the current column page.
+        """
+        starts = self.col_page_starts
+        if not starts:
+            return 0, 0
+        start_col = starts[self.current_col_page]
+        if self.current_col_page + 1 < len(starts):
+            return start_col, starts[self.current_col_page + 1]
+        return start_col, len(self.current_table['columns'])
+
+    def _fit_page_to_window(self):
+        """
+        Shows no more rows per page than fit between the header and status lines of the curses
+        window, and no more columns than fit in its width, keeping the first row and column of
+        the current page in view.
+        """
+        first_row = self.current_page * self.rows_per_page
+        self.rows_per_page = max(1, min(self.page_size, curses.LINES - 6))
+        self.current_page = first_row // self.rows_per_page
+        self.window_width = curses.COLS - 1  # _draw_line() leaves the last column free
+        if self.current_table is not None:
+            first_col = self._column_page_range()[0]
+            self._update_page_counts()
+            self.current_col_page = max(0, bisect_right(self.col_page_starts, first_col) - 1)
 
     def list_tables_curses(self, stdscr, table_page):
         """
@@ -294,10 +847,6 @@ class SpreadsheetNavigator:
                 self.search_table_curses(stdscr)
                 # After search, if a table is selected, break out to display data
                 if self.current_table is not None:
-                    # Initialize row search variables
-                    self.all_rows = self.current_table['rows']
-                    self.filtered_rows = self.all_rows.copy()
-                    self.search_active = False
                     break
             elif input_str.isdigit():
                 selection = int(input_str)
@@ -307,13 +856,7 @@ class SpreadsheetNavigator:
                 tables_on_page = list(self.tables.keys())[start_idx:end_idx]
                 if 1 <= selection <= len(tables_on_page):
                     table_name = tables_on_page[selection - 1]
-                    self.current_table = self.tables[table_name]
-                    self.current_page = 0
-                    self.current_col_page = 0
-                    self.current_table_page = 0  # Reset table list page after selection
-                    self.all_rows = self.current_table['rows']
-                    self.filtered_rows = self.all_rows.copy()
-                    self.search_active = False
+                    self._set_current_table(table_name)
                     self.show_message(stdscr, f"Selected table: {table_name}. Press any key to continue.")
                     stdscr.getch()
                     break
@@ -367,13 +910,7 @@ class SpreadsheetNavigator:
                     # Select the first match or prompt if multiple
                     if len(filtered_tables) == 1:
                         table_name = filtered_tables[0]
-                        self.current_table = self.tables[table_name]
-                        self.current_page = 0
-                        self.current_col_page = 0
-                        self.current_table_page = 0  # Reset table list page after selection
-                        self.all_rows = self.current_table['rows']
-                        self.filtered_rows = self.all_rows.copy()
-                        self.search_active = False
+                        self._set_current_table(table_name)
                         self.show_message(stdscr, f"Selected table: {table_name}. Press any key to continue.")
                         stdscr.getch()
                         return
@@ -426,142 +963,167 @@ class SpreadsheetNavigator:
                     selected += 1
             elif key in [curses.KEY_ENTER, 10, 13]:
                 table_name = filtered_tables[selected]
-                self.current_table = self.tables[table_name]
-                self.current_page = 0
-                self.current_col_page = 0
-                self.current_table_page = 0  # Reset table list page after selection
-                self.all_rows = self.current_table['rows']
-                self.filtered_rows = self.all_rows.copy()
-                self.search_active = False
+                self._set_current_table(table_name)
                 self.show_message(stdscr, f"Selected table: {table_name}. Press any key to continue.")
                 stdscr.getch()
                 break
 
+    def _column_widths(self):
+        """
+        Returns the display width of each column of the current table, limited to 30 for
+        readability. Computed over all rows the first time the table is displayed, then cached.
+        """
+        table = self.current_table
+        if 'col_widths' not in table:
+            # str(None) is as long as 'NULL', so values can be measured without special-casing
+            table['col_widths'] = [
+                max(len(col), min(max(map(len, map(str, col_array)), default=0), 30))
+                for col, col_array in zip(table['columns'], table['col_arrays'])
+            ]
+        return table['col_widths']
+
+    def _page_cells(self, start_row, end_row, start_col, end_col):
+        """
+        Returns the display strings of the given window of the filtered rows, as one list per
+        column. Strings are cached per cell until another table is selected, so paging back
+        over rows already seen only looks them up.
+        """
+        page_rows = self.filtered_rows[start_row:end_row]
+        col_arrays = self.current_table['col_arrays']
+        page = []
+        for col_index in range(start_col, min(end_col, len(col_arrays))):
+            col_array = col_arrays[col_index]
+            cache = self._display_cache.setdefault(col_index, {})
+            cells = []
+            for row in page_rows:
+                cell = cache.get(row)
+                if cell is None:
+                    cell = cache[row] = _display_value(col_array[row])
+                cells.append(cell)
+            page.append(cells)
+        return page
+
+    def _view_layout(self, start_col, end_col):
+        """
+        Returns (padded widths, header, separator, row format) for a window of the current
+        table's columns. Kept until the window or the table changes, so a redraw only formats
+        the rows and status lines.
+        """
+        if self._layout_key != (start_col, end_col):
+            display_columns = self.current_table['columns'][start_col:end_col]
+            # Column widths are computed once per table, then sliced to the window
+            padded_widths = [width + 2 for width in self._column_widths()[start_col:end_col]]
+            row_format = "| ".join("{:<%d}" % width for width in padded_widths)
+            header = row_format.format(*display_columns).rstrip("| ")
+            separator = "+ ".join('-' * width for width in padded_widths).rstrip("+ ")
+            self._layout = (padded_widths, header, separator, row_format)
+            self._layout_key = (start_col, end_col)
+        return self._layout
+
     def display_page_curses(self, stdscr):
         """
         Displays the current page of the selected table within the curses window.
-        Handles column pagination and row search filtering.
+        Handles column pagination and row search filtering. The frame is only written to the
+        window; the caller pushes it to the terminal with noutrefresh() and doupdate().
         """
-        stdscr.clear()
         if self.current_table is None:
+            stdscr.erase()
+            self._prev_lines = []
             return
 
         # Determine which rows to display
         total_rows = len(self.filtered_rows)
-        total_pages = (total_rows // self.page_size) + (1 if total_rows % self.page_size else 0)
-        start_row = self.current_page * self.page_size
-        end_row = start_row + self.page_size
-        page_data = self.filtered_rows[start_row:end_row]
+        start_row = self.current_page * self.rows_per_page
+        end_row = start_row + self.rows_per_page
         columns = self.current_table['columns']
 
-        # Calculate total column pages
-        total_col_pages = (len(columns) // self.col_page_size) + (1 if len(columns) % self.col_page_size else 0)
+        # Determine which columns to display based on current_col_page; column pages are
+        # fitted to the window width, so all of them are shown
+        start_col, end_col = self._column_page_range()
+        padded_widths, header, separator, _ = self._view_layout(start_col, end_col)
+        # Gather the page column by column and pivot it into rows only as it is drawn
+        display_data = zip(*self._page_cells(start_row, end_row, start_col, end_col))
 
-        # Determine which columns to display based on current_col_page
-        start_col = self.current_col_page * self.col_page_size
-        end_col = start_col + self.col_page_size
-        display_columns = columns[start_col:end_col]
-        display_data = [row[start_col:end_col] for row in page_data]
-
-        # Calculate column widths
-        col_widths = {}
-        for idx, col in enumerate(display_columns):
-            max_len = len(col)
-            for row in display_data:
-                if idx >= len(row):
-                    continue
-                val = row[idx]
-                val_str = 'NULL' if val is None else str(val)
-                if len(val_str) > max_len:
-                    max_len = min(len(val_str), 30)  # Limit to 30 for readability
-            col_widths[col] = max_len + 2  # Add padding
-
-        # Prepare header
-        header = ""
-        for col in display_columns:
-            header += f"{col.ljust(col_widths[col])}| "
-        header = header.rstrip("| ")
-
-        # Prepare separator
-        separator = ""
-        for col in display_columns:
-            separator += f"{'-' * col_widths[col]}+ "
-        separator = separator.rstrip("+ ")
-
-        # Display header and separator
-        try:
-            stdscr.addstr(0, 0, header)
-            stdscr.addstr(1, 0, separator)
-        except curses.error:
-            pass  # Handle cases where the terminal window is too small
+        # The frame as (text, highlight spans) per screen line, drawn once it is complete
+        lines = [('', [])] * curses.LINES
+        lines[0] = (header, [])
+        lines[1] = (separator, [])
+
+        # Search terms to highlight, if search is active
+        terms = self.search_query.lower().split() if self.search_active else []
 
         # Display rows
         for i, row in enumerate(display_data, start=2):
-            row_str = ""
-            for idx, val in enumerate(row):
-                if idx >= len(display_columns):
-                    continue
-                val_str = 'NULL' if val is None else str(val)
-                # Highlight search matches if search is active
-                if self.search_active:
-                    # Find all occurrences of the search query in the row
-                    matches = self.search_query.lower().split()
-                    for match in matches:
-                        if match and match in val_str.lower():
-                            # Find start indices of matches
-                            start = 0
-                            while True:
-                                start = val_str.lower().find(match, start)
-                                if start == -1:
-                                    break
-                                # Highlight the match
-                                try:
-                                    stdscr.addstr(i, 0, row_str)  # Display accumulated string
-                                    stdscr.attron(curses.A_STANDOUT)
-                                    stdscr.addstr(i, len(row_str), val_str[start:start+len(match)])
-                                    stdscr.attroff(curses.A_STANDOUT)
-                                except curses.error:
-                                    pass
-                                start += len(match)
-                if len(val_str) > 30:
-                    val_str = val_str[:27] + "..."
-                row_str += f"{val_str.ljust(col_widths[display_columns[idx]])}| "
-            row_str = row_str.rstrip("| ")
-            try:
-                stdscr.addstr(i, 0, row_str)
-            except curses.error:
-                # Handle cases where the terminal window is too small
-                pass
+            if i >= curses.LINES:
+                break
+            cells = []
+            spans = []  # Positions of search matches within row_str
+            offset = 0
+            for val_str, width in zip(row, padded_widths):
+                if terms:
+                    spans.extend((offset + start, offset + end) for start, end in _match_spans(val_str, terms))
+                cell = val_str.ljust(width)
+                cells.append(cell)
+                offset += len(cell) + 2
+            lines[i] = ("| ".join(cells).rstrip("| "), spans)
 
         # Display page information at the bottom
-        page_info = f"Rows: {start_row + 1}-{min(end_row, total_rows)} of {total_rows} | Pages: {self.current_page + 1}/{total_pages}"
-        col_info = f"Columns: {start_col + 1}-{min(end_col, len(columns))} of {len(columns)} | Column Pages: {self.current_col_page + 1}/{total_col_pages}"
-        search_info = f"Search: {'Active' if self.search_active else 'Inactive'}"
-        try:
-            stdscr.addstr(curses.LINES - 4, 0, page_info)
-            stdscr.addstr(curses.LINES - 3, 0, col_info)
-            stdscr.addstr(curses.LINES - 2, 0, search_info)
-            stdscr.addstr(curses.LINES - 1, 0, "Commands: [n] Next Page | [p] Previous Page | [l] Left Columns | [r] Right Columns | [s] Select Another Table | [/ ] Search Rows | [c] Clear Search | [q] Quit")
-        except curses.error:
-            pass  # Handle cases where the terminal window is too small
+        page_info = _PAGE_STATUS % (start_row + 1, min(end_row, total_rows), total_rows, self.current_page + 1, self.total_pages)
+        col_info = _COLUMN_STATUS % (start_col + 1, min(end_col, len(columns)), len(columns), self.current_col_page + 1, self.total_col_pages)
+        search_info = _SEARCH_STATUS[self.search_active]
+        lines[-4:] = [
+            (page_info, []),
+            (col_info, []),
+            (search_info, []),
+            ("Commands: [n] Next Page | [p] Previous Page | [l] Left Columns | [r] Right Columns | [s] Select Another Table | [/ ] Search Rows | [c] Clear Search | [q] Quit", []),
+        ]
+        self._draw_frame(stdscr, lines)
+
+    def _draw_frame(self, stdscr, lines):
+        """
+        Writes a page frame to the window, rewriting only the lines that differ from the
+        previous frame. Anything else drawn on the window since then must reset _prev_lines.
+        """
+        if len(self._prev_lines) != len(lines):
+            # erase() rather than clear(), which would make curses repaint the whole terminal
+            stdscr.erase()
+            self._prev_lines = [('', [])] * len(lines)
+        for y, (line, prev_line) in enumerate(zip(lines, self._prev_lines)):
+            if line == prev_line:
+                continue
+            text, spans = line
+            try:
+                stdscr.move(y, 0)
+                stdscr.clrtoeol()
+            except curses.error:
+                continue
+            if text and _draw_line(stdscr, y, text):
+                # Highlight search matches in place, one call per match within the window
+                for start, end in spans:
+                    end = min(end, curses.COLS - 1)
+                    if start < end:
+                        stdscr.chgat(y, start, end - start, curses.A_STANDOUT)
+        self._prev_lines = lines
 
     def navigate_with_curses(self, stdscr):
         """
         Main loop to navigate through the spreadsheet using curses.
         """
         curses.curs_set(0)  # Hide cursor
+        self._fit_page_to_window()
         while True:
             self.select_table_curses(stdscr)
             while True:
                 self.display_page_curses(stdscr)
-                stdscr.refresh()
+                stdscr.noutrefresh()
+                curses.doupdate()
                 key = stdscr.getch()
 
                 if key in [ord('q'), ord('Q')]:
                     sys.exit(0)
                 elif key in [ord('n'), ord('N')]:
                     # Next row page
-                    if (self.current_page + 1) * self.page_size < len(self.filtered_rows):
+                    if self.current_page + 1 < self.total_pages:
                         self.current_page += 1
                 elif key in [ord('p'), ord('P')]:
                     # Previous row page
@@ -569,8 +1131,7 @@ class SpreadsheetNavigator:
                         self.current_page -= 1
                 elif key in [ord('r'), curses.KEY_RIGHT]:
                     # Right column page
-                    total_col_pages = (len(self.current_table['columns']) // self.col_page_size) + (1 if len(self.current_table['columns']) % self.col_page_size else 0)
-                    if (self.current_col_page + 1) < total_col_pages:
+                    if (self.current_col_page + 1) < self.total_col_pages:
                         self.current_col_page += 1
                 elif key in [ord('l'), curses.KEY_LEFT]:
                     # Left column page
@@ -584,12 +1145,19 @@ class SpreadsheetNavigator:
                 elif key in [ord('/'), ord('?')]:
                     # Initiate row search
                     self.row_search_curses(stdscr)
+                    self._prev_lines = []  # The prompt and messages were drawn over the page
                 elif key in [ord('c'), ord('C')]:
                     # Clear row search
                     if self.search_active:
                         self.clear_row_search()
                         self.show_message(stdscr, "Search filter cleared. Displaying all rows.")
                         stdscr.getch()
+                        self._prev_lines = []
+                elif key == curses.KEY_RESIZE:
+                    # Pick up the new terminal size and redraw the page in full
+                    curses.update_lines_cols()
+                    self._fit_page_to_window()
+                    self._prev_lines = []
                 else:
                     pass  # Ignore other keys
 
@@ -655,104 +1223,109 @@ class SpreadsheetNavigator:
                 table_num = int(selection)
                 if 1 <= table_num <= len(tables_on_page):
                     table_name = tables_on_page[table_num - 1]
-                    self.current_table = self.tables[table_name]
-                    self.current_page = 0
-                    self.current_col_page = 0
-                    self.current_table_page = 0
-                    self.all_rows = self.current_table['rows']
-                    self.filtered_rows = self.all_rows.copy()
-                    self.search_active = False
+                    self._set_current_table(table_name)
+                    # Only reported here: in curses mode a print would write over the window
+                    if self.parser.verbose:
+                        print(f"Inserted {self.current_table['row_count']} rows into table '{table_name}'.")
                     break
                 else:
                     print("Invalid table number. Please try again.")
 
     def display_page(self):
         """
-        Displays the current page of the selected table.
+        Returns the current page of the selected table as text, so that it can be written
+        to the terminal in one go.
         """
         if self.current_table is None:
-            return
+            return ""
 
         total_rows = len(self.filtered_rows)
-        total_pages = (total_rows // self.page_size) + (1 if total_rows % self.page_size else 0)
-        start_row = self.current_page * self.page_size
-        end_row = start_row + self.page_size
-        page_data = self.filtered_rows[start_row:end_row]
+        start_row = self.current_page * self.rows_per_page
+        end_row = start_row + self.rows_per_page
         columns = self.current_table['columns']
 
-        total_col_pages = (len(columns) // self.col_page_size) + (1 if len(columns) % self.col_page_size else 0)
         start_col = self.current_col_page * self.col_page_size
         end_col = start_col + self.col_page_size
-        display_columns = columns[start_col:end_col]
-        display_data = [row[start_col:end_col] for row in page_data]
-
-        # Calculate column widths
-        col_widths = {}
-        for idx, col in enumerate(display_columns):
-            max_len = len(col)
-            for row in display_data:
-                if idx >= len(row):
-                    continue
-                val = row[idx]
-                val_str = 'NULL' if val is None else str(val)
-                if len(val_str) > max_len:
-                    max_len = min(len(val_str), 30)
-            col_widths[col] = max_len + 2
-
-        # Prepare header
-        header = ""
-        for col in display_columns:
-            header += f"{col.ljust(col_widths[col])}| "
-        header = header.rstrip("| ")
-
-        # Prepare separator
-        separator = ""
-        for col in display_columns:
-            separator += f"{'-' * col_widths[col]}+ "
-        separator = separator.rstrip("+ ")
-
-        # Display header and separator
-        print(header)
-        print(separator)
+        _, header, separator, row_format = self._view_layout(start_col, end_col)
+        # Gather the page column by column and pivot it into rows only as it is drawn
+        display_data = zip(*self._page_cells(start_row, end_row, start_col, end_col))
+        lines = [header, separator]
 
         # Display rows
         for row in display_data:
-            row_str = ""
-            for idx, val in enumerate(row):
-                if idx >= len(display_columns):
-                    continue
-                val_str = 'NULL' if val is None else str(val)
-                if len(val_str) > 30:
-                    val_str = val_str[:27] + "..."
-                row_str += f"{val_str.ljust(col_widths[display_columns[idx]])}| "
-            print(row_str.rstrip("| "))
-        print(separator)
+            lines.append(row_format.format(*row).rstrip("| "))
+        lines.append(separator)
 
         # Display page information
-        print(f"Rows: {start_row + 1}-{min(end_row, total_rows)} of {total_rows} | Pages: {self.current_page + 1}/{total_pages}")
-        print(f"Columns: {start_col + 1}-{min(end_col, len(columns))} of {len(columns)} | Column Pages: {self.current_col_page + 1}/{total_col_pages}")
-        print(f"Search: {'Active' if self.search_active else 'Inactive'}")
+        lines.append(_PAGE_STATUS % (start_row + 1, min(end_row, total_rows), total_rows, self.current_page + 1, self.total_pages))
+        lines.append(_COLUMN_STATUS % (start_col + 1, min(end_col, len(columns)), len(columns), self.current_col_page + 1, self.total_col_pages))
+        lines.append(_SEARCH_STATUS[self.search_active])
+        return "\n".join(lines) + "\n"
 
     def apply_row_search(self, query):
         """
-        Filters rows based on the search query.
+        Filters rows based on the search query, keeping the rows that contain every
+        whitespace-separated term of it, ignoring case.
         """
-        self.filtered_rows = []
-        query_lower = query.lower()
-        for row in self.all_rows:
-            for cell in row:
-                if cell is not None and query_lower in str(cell).lower():
-                    self.filtered_rows.append(row)
-                    break  # Move to next row after first match
+        terms = [term.encode() for term in query.lower().split()]
+        # The longest term is the likeliest to be rare, so the text is scanned for it and the
+        # other terms are only checked in the rows of the blocks where it occurs
+        scan_term = max(terms, key=len)
+        other_terms = [term for term in terms if term != scan_term]
+        # Built on the first search of a table, so tables that are only browsed never pay for it
+        search_index = self.current_table.get('search_index')
+        if search_index is None:
+            search_index = self.current_table['search_index'] = _build_search_index(self.current_table)
+        text, offsets = search_index
+
+        # When each previous term is part of a new one (e.g. the query was extended), only the rows
+        # the previous search kept can match. If they are fewer than the blocks of the text,
+        # checking just them is cheaper than scanning the text again
+        previous_terms = [term.encode() for term in self.search_query.lower().split()] if self.search_active else []
+        if (previous_terms and len(self.filtered_rows) < len(offsets) - 1
+                and all(any(old in new for new in terms) for old in previous_terms)):
+            filtered_rows = []
+            block = -1
+            for row in self.filtered_rows:
+                if row // _SEARCH_BLOCK_ROWS != block:
+                    block = row // _SEARCH_BLOCK_ROWS
+                    block_rows = text[offsets[block]:offsets[block + 1] - 1].split(_SEARCH_ROW_SEP_BYTES)
+                blob = block_rows[row - block * _SEARCH_BLOCK_ROWS]
+                if all(term in blob for term in terms):
+                    filtered_rows.append(row)
+            self.filtered_rows = filtered_rows
+            self.search_query = query
+            self._update_page_counts()
+            return
+
+        # Scan the whole text for the next match and only check the rows of the block it falls in,
+        # so blocks without a match are skipped inside a single find() call
+        filtered_rows = []
+        pos = text.find(scan_term)
+        while pos != -1:
+            block = bisect_right(offsets, pos) - 1
+            block_end = offsets[block + 1] - 1
+            block_rows = enumerate(text[offsets[block]:block_end].split(_SEARCH_ROW_SEP_BYTES), block * _SEARCH_BLOCK_ROWS)
+            if other_terms:
+                filtered_rows.extend([
+                    row for row, blob in block_rows
+                    if scan_term in blob and all(term in blob for term in other_terms)
+                ])
+            else:
+                filtered_rows.extend([row for row, blob in block_rows if scan_term in blob])
+            pos = text.find(scan_term, block_end)
+        self.filtered_rows = filtered_rows
         self.search_active = True
         self.search_query = query
+        self._update_page_counts()
 
     def clear_row_search(self):
         """
         Clears the current row search filter.
         """
-        self.filtered_rows = self.all_rows.copy()
+        self.filtered_rows = self.all_rows
         self.search_active = False
+        self._update_page_counts()
         self.search_query = ""
 
     def show_message(self, stdscr, message):
@@ -773,11 +1346,11 @@ class SpreadsheetNavigator:
         while True:
             self.select_table()
             while True:
-                self.display_page()
-                print("\nCommands: [n] Next Page | [p] Previous Page | [l] Left Columns | [r] Right Columns | [s] Select Another Table | [/ ] Search Rows | [c] Clear Search | [q] Quit")
+                # The whole frame goes out in a single write, flushed by the input() prompt
+                sys.stdout.write(self.display_page() + "\nCommands: [n] Next Page | [p] Previous Page | [l] Left Columns | [r] Right Columns | [s] Select Another Table | [/ ] Search Rows | [c] Clear Search | [q] Quit\n")
                 cmd = input("Enter command: ").strip().lower()
                 if cmd == 'n':
-                    if (self.current_page + 1) * self.page_size >= len(self.filtered_rows):
+                    if self.current_page + 1 >= self.total_pages:
                         print("You are on the last page.")
                     else:
                         self.current_page += 1
@@ -792,8 +1365,7 @@ class SpreadsheetNavigator:
                     else:
                         print("You are on the first column page.")
                 elif cmd == 'r':
-                    total_col_pages = (len(self.current_table['columns']) // self.col_page_size) + (1 if len(self.current_table['columns']) % self.col_page_size else 0)
-                    if (self.current_col_page + 1) < total_col_pages:
+                    if (self.current_col_page + 1) < self.total_col_pages:
                         self.current_col_page += 1
                     else:
                         print("You are on the last column page.")
@@ -825,11 +1397,24 @@ def main_curses(stdscr, navigator):
     """
     navigator.navigate_with_curses(stdscr)
 
+def _job_count(value):
+    """
+    Argument type of --jobs: a whole number of processes, at least 1.
+    """
+    try:
+        jobs = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'")
+    if jobs < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {jobs}")
+    return jobs
+
 def main():
     parser = argparse.ArgumentParser(description="Parse SQL dump files.")
     parser.add_argument("filepath", help="Path to the SQL dump file")
     parser.add_argument("--verbose", action="store_true", help="Enable verbose output")
     parser.add_argument("--nocurses", action="store_true", help="Disable curses-based navigation")
+    parser.add_argument("--jobs", type=_job_count, help="Number of processes used to parse the rows of large tables (default: number of CPUs)")
     args = parser.parse_args()
 
     if not os.path.isfile(args.filepath):
@@ -840,14 +1425,14 @@ def main():
     print (f"SQL Dump File Navigator Copyright (C)2024 Kirk Bowe.")
     print (f"This program comes with ABSOLUTELY NO WARRANTY; for details see the included LICENCE file.\n")    
 
-    sql_parser = SQLDumpParser(args.filepath, verbose=args.verbose)
+    sql_parser = SQLDumpParser(args.filepath, verbose=args.verbose, jobs=args.jobs)
     sql_parser.parse()
 
     if not sql_parser.tables:
         print("No tables found in the SQL dump.")
         sys.exit(0)
 
-    navigator = SpreadsheetNavigator(sql_parser.tables)
+    navigator = SpreadsheetNavigator(sql_parser)
 
     if args.nocurses:
         navigator.navigate()